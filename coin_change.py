@@ -1,6 +1,98 @@
+import sys
+from functools import lru_cache
+
+# Coin table shown by display_result: (denomination, limit, status)
+_COIN_INFO = (
+    (50, 10, "limited"),
+    (20, 25, "limited"),
+    (2, None, "unlimited"),
+    (1, None, "unlimited"),
+)
+_SEP = "-" * 40
+
+# Banner printed once by main()
+_HEADER = """Coin Change Calculator (Limited Quantities)
+Available coins:
+  50¢: 10 coins available (limited)
+  20¢: 25 coins available (limited)
+   2¢: unlimited
+   1¢: unlimited
+""" + "=" * 50 + "\n"
+
+def _breakdown(amount, n50):
+    """Return the (n50, n20, n2, n1) breakdown of amount when using n50 50¢ coins."""
+    rem1 = amount - 50 * n50
+    n20 = rem1 // 20
+    if n20 > 25:
+        n20 = 25
+    rem2 = rem1 - 20 * n20
+    return (n50, n20, rem2 >> 1, rem2 & 1)
+
+@lru_cache(maxsize=1024)
+def _calculate_coins_core(amount):
+    """
+    Find the optimal coin breakdown for amount as a (n50, n20, n2, n1) tuple.
+    
+    Returns a hashable tuple so results can be cached; repeated amounts are
+    answered from the cache without redoing the search.
+    
+    The coin set is fixed, so the denominations (50, 20, 2, 1) and the limits
+    (at most 10 × 50¢ and 25 × 20¢) are written inline as literals rather
+    than looked up from a table on every step.
+    
+    Raises:
+        ValueError: If amount is negative
+    """
+    if amount < 0:
+        raise ValueError(f"amount must be non-negative, got {amount}")
+    
+    # No solution needs more than amount coins (all 1¢), so amount + 1 is an
+    # unreachable int sentinel that keeps every comparison int-to-int.
+    best_total = amount + 1
+    best_n50 = 0
+    
+    max_n50 = amount // 50
+    if max_n50 > 10:
+        max_n50 = 10
+    
+    # Greedy fast path: with as many 50¢ coins as possible, if the remainder
+    # is less than 10 past a multiple of 20, giving back 50¢ coins can only
+    # add coins (two 50¢ become five 20¢, one 50¢ becomes two 20¢ + five 2¢),
+    # so the greedy breakdown is optimal. Only remainders like 62¢ (3×20¢
+    # beats 50¢ + 6×2¢) need the full search below.
+    if (amount - 50 * max_n50) % 20 < 10:
+        return _breakdown(amount, max_n50)
+    
+    # Sweep the 50¢ count upward, peeling one 50¢ off the remainder per step
+    rem1 = amount
+    for n50 in range(max_n50 + 1):
+        # For a fixed number of 50¢ coins, each extra 20¢ coin replaces ten
+        # 2¢ coins without changing the parity of the residue, so using as
+        # many 20¢ coins as allowed is always best. The clamp is kept inline
+        # (same as in _breakdown) so the hot loop makes no function calls.
+        n20 = rem1 // 20
+        if n20 > 25:
+            n20 = 25
+        rem2 = rem1 - 20 * n20
+        
+        # The residue is always covered by 2¢ coins plus at most one 1¢
+        n2 = rem2 >> 1
+        n1 = rem2 & 1
+        
+        total = n50 + n20 + n2 + n1
+        if total < best_total:
+            best_total = total
+            best_n50 = n50
+        
+        rem1 -= 50
+    
+    # Only the winning 50¢ count is kept inside the loop; rebuild the rest of
+    # the breakdown once here instead of allocating a tuple per improvement.
+    return _breakdown(amount, best_n50)
+
 def calculate_coins(amount):
     """
-    Calculate the minimum number of coins needed to make the given amount using dynamic programming.
+    Calculate the minimum number of coins needed to make the given amount.
     
     This algorithm handles limited coin quantities:
     - 50¢ coins: maximum 10 available
@@ -8,10 +100,14 @@ def calculate_coins(amount):
     - 2¢ coins: unlimited
     - 1¢ coins: unlimited
     
-    Uses dynamic programming with state tracking for limited denominations.
+    Only the 50¢ and 20¢ coins are limited, and any residue left after them
+    is best covered by as many 2¢ coins as possible plus at most one 1¢ coin.
+    So instead of a DP table, every possible number of 50¢ coins is tried
+    with as many 20¢ coins as fit, and the one with the fewest total coins
+    is kept. Results are cached per amount.
     
-    Time Complexity: O(amount × coin_limits)
-    Space Complexity: O(amount × coin_states)
+    Time Complexity: O(1) (at most 11 candidates, independent of amount)
+    Space Complexity: O(1)
     
     Args:
         amount (int): The amount in cents to make change for
@@ -19,75 +115,39 @@ def calculate_coins(amount):
     Returns:
         dict: Dictionary with coin denominations as keys and their counts as values
               Format: {50: count, 20: count, 2: count, 1: count}
-              Returns all zeros if no solution possible with given constraints
               
+    Raises:
+        ValueError: If amount is negative
+        
     Example:
         >>> calculate_coins(62)
         {50: 0, 20: 3, 2: 1, 1: 0}  # 3×20¢ + 1×2¢ = 4 total coins
-        >>> calculate_coins(1200)  # Large amount requiring all 50¢ coins
-        {50: 10, 20: 25, 2: 0, 1: 0}  # Uses all limited coins: 10×50¢ + 25×20¢ = 1000¢
+        >>> calculate_coins(1200)  # Large amount requiring all limited coins
+        {50: 10, 20: 25, 2: 100, 1: 0}  # 10×50¢ + 25×20¢ + 100×2¢ = 1200¢
     """
-    # Coin denominations and their limits
-    # Format: (value, max_quantity) - None means unlimited
-    coin_limits = [(50, 10), (20, 25), (2, None), (1, None)]
-    denominations = [50, 20, 2, 1]
-    
-    # For limited coins, we need to track states: (amount, coins_used_so_far)
-    # dp[i][j][k] = minimum coins for amount i, using j 50¢ coins, k 20¢ coins
-    # We'll use a different approach: track the state as we build solutions
-    
-    # Simple DP with constraint checking
-    # dp[i] = minimum coins needed for amount i (considering all constraints)
-    dp = [float('inf')] * (amount + 1)
-    dp[0] = 0
-    
-    # parent[i] = (coin_used, previous_amount) to reconstruct solution
-    parent = [(-1, -1)] * (amount + 1)
-    
-    # Fill the DP table with constraint checking
-    for i in range(1, amount + 1):
-        # Try each coin denomination with its limit
-        for coin_value, max_qty in coin_limits:
-            if coin_value <= i:  # Can use this coin
-                # Check if using this coin gives a better solution
-                prev_amount = i - coin_value
-                if dp[prev_amount] != float('inf'):
-                    # Count how many of this coin type we would use in total
-                    temp_count = {50: 0, 20: 0, 2: 0, 1: 0}
-                    
-                    # Trace back to count coins used so far
-                    curr = prev_amount
-                    while curr > 0 and parent[curr][0] != -1:
-                        used_coin = parent[curr][0]
-                        temp_count[used_coin] += 1
-                        curr = parent[curr][1]
-                    
-                    # Check if we can use one more of this coin type
-                    can_use_coin = True
-                    if max_qty is not None:  # Limited coin
-                        if temp_count[coin_value] >= max_qty:
-                            can_use_coin = False
-                    
-                    # Update if this gives a better solution and we can use the coin
-                    if can_use_coin and dp[prev_amount] + 1 < dp[i]:
-                        dp[i] = dp[prev_amount] + 1
-                        parent[i] = (coin_value, prev_amount)
-    
-    # Reconstruct the optimal solution considering coin limits
-    coin_count = {50: 0, 20: 0, 2: 0, 1: 0}
-    
-    # Check if a solution exists with the given constraints
-    if dp[amount] == float('inf'):
-        return coin_count  # Return all zeros if no solution possible
-    
-    # Trace back from target amount to 0, following the parent pointers
-    current = amount
-    while current > 0 and parent[current][0] != -1:
-        coin_used, prev_amount = parent[current]
-        coin_count[coin_used] += 1
-        current = prev_amount
-    
-    return coin_count
+    n50, n20, n2, n1 = _calculate_coins_core(amount)
+    return {50: n50, 20: n20, 2: n2, 1: n1}
+
+def calculate_coins_many(amounts):
+    """
+    Calculate the minimum coins for several amounts in one call.
+    
+    All amounts share the per-amount cache behind calculate_coins, so
+    duplicate amounts in the batch (or from earlier calls) are only
+    searched once.
+    
+    Args:
+        amounts (iterable of int): The amounts in cents to make change for
+        
+    Returns:
+        list: One dictionary per amount, in the same order as amounts,
+              each in the format returned by calculate_coins()
+              
+    Example:
+        >>> calculate_coins_many([62, 100])
+        [{50: 0, 20: 3, 2: 1, 1: 0}, {50: 2, 20: 0, 2: 0, 1: 0}]
+    """
+    return [calculate_coins(amount) for amount in amounts]
 
 def display_result(amount, coin_count):
     """
@@ -97,47 +157,36 @@ def display_result(amount, coin_count):
         amount (int): The original amount requested
         coin_count (dict): Dictionary with coin counts
     """
-    print(f"\nTo make {amount} cents, you need:")
-    print("-" * 40)
+    # Collect the lines and write them in one call instead of one print each
+    lines = [f"\nTo make {amount} cents, you need:", _SEP]
     
     total_coins = sum(coin_count.values())
     
     # Show coin usage with limits
-    coin_info = [
-        (50, 10, "limited"),
-        (20, 25, "limited"), 
-        (2, None, "unlimited"),
-        (1, None, "unlimited")
-    ]
-    
-    for denom, limit, status in coin_info:
+    for denom, limit, status in _COIN_INFO:
         count = coin_count[denom]
         if count > 0:
             if limit is not None:
-                print(f"{count:2d} x {denom:2d}¢ coins (max {limit} available - {status})")
+                lines.append(f"{count:2d} x {denom:2d}¢ coins (max {limit} available - {status})")
             else:
-                print(f"{count:2d} x {denom:2d}¢ coins ({status})")
+                lines.append(f"{count:2d} x {denom:2d}¢ coins ({status})")
     
-    print("-" * 40)
-    print(f"Total coins needed: {total_coins}")
+    lines.append(_SEP)
+    lines.append(f"Total coins needed: {total_coins}")
     
     # Show remaining coin availability
     remaining_50 = 10 - coin_count[50] 
     remaining_20 = 25 - coin_count[20]
     if total_coins > 0:
-        print(f"Remaining: {remaining_50} x 50¢, {remaining_20} x 20¢")
+        lines.append(f"Remaining: {remaining_50} x 50¢, {remaining_20} x 20¢")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """
     Main function to run the coin change program with limited coin quantities.
     """
-    print("Coin Change Calculator (Limited Quantities)")
-    print("Available coins:")
-    print("  50¢: 10 coins available (limited)")
-    print("  20¢: 25 coins available (limited)")
-    print("   2¢: unlimited")
-    print("   1¢: unlimited")
-    print("=" * 50)
+    sys.stdout.write(_HEADER)
     
     while True:
         try:
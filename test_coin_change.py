@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Test cases for the coin_change.py module.
-Tests the dynamic programming coin change algorithm with various scenarios.
+Tests the limited-coin search algorithm with various scenarios.
 """
 
 import sys
@@ -10,7 +10,7 @@ import os
 # Add the current directory to the path so we can import coin_change
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from coin_change import calculate_coins
+from coin_change import calculate_coins, calculate_coins_many
 
 def test_coin_change():
     """Run comprehensive tests for the coin change algorithm."""
@@ -45,6 +45,10 @@ def test_coin_change():
         (72, {50: 1, 20: 1, 2: 1, 1: 0}), # 1×50¢ + 1×20¢ + 1×2¢
         (100, {50: 2, 20: 0, 2: 0, 1: 0}), # 2×50¢
         (123, {50: 2, 20: 1, 2: 1, 1: 1}), # 2×50¢ + 1×20¢ + 1×2¢ + 1×1¢
+        
+        # Cases that exhaust the limited coins
+        (1000, {50: 10, 20: 25, 2: 0, 1: 0}), # All limited coins: 10×50¢ + 25×20¢
+        (1201, {50: 10, 20: 25, 2: 100, 1: 1}), # Limited coins + 100×2¢ + 1×1¢
     ]
     
     passed_tests = 0
@@ -55,8 +59,8 @@ def test_coin_change():
             result = calculate_coins(amount)
             
             # Calculate total coins and verify amount
-            total_coins = sum(result.values())
-            total_amount = sum(coin * count for coin, count in result.items())
+            total_coins = result[50] + result[20] + result[2] + result[1]
+            total_amount = 50 * result[50] + 20 * result[20] + 2 * result[2] + result[1]
             
             # Check if result matches expected
             if result == expected and total_amount == amount:
@@ -131,8 +135,69 @@ def test_coin_change():
 
 
 
+def test_calculate_coins_many():
+    """Test the batch API: ordering, duplicate amounts, and empty input."""
+    
+    print("\n" + "=" * 50)
+    print("Testing calculate_coins_many")
+    print("=" * 50)
+    
+    all_passed = True
+    
+    def check(name, condition):
+        nonlocal all_passed
+        if condition:
+            print(f"✅ {name} - PASSED")
+        else:
+            print(f"❌ {name} - FAILED")
+            all_passed = False
+    
+    try:
+        # Results come back in input order, from any iterable
+        results = calculate_coins_many(amount for amount in [62, 1, 100])
+        check("Results in input order", results == [
+            {50: 0, 20: 3, 2: 1, 1: 0},
+            {50: 0, 20: 0, 2: 0, 1: 1},
+            {50: 2, 20: 0, 2: 0, 1: 0},
+        ])
+        
+        # Duplicate amounts share the cache but must not share a dict
+        results = calculate_coins_many([62, 62])
+        check("Duplicate amounts give equal results", results[0] == results[1])
+        results[0][20] = 99
+        check("Duplicate amounts give independent dicts", results[1][20] == 3)
+        
+        # An empty batch gives an empty list
+        check("Empty input gives empty list", calculate_coins_many([]) == [])
+        
+    except Exception as e:
+        print(f"❌ calculate_coins_many - ERROR: {e}")
+        all_passed = False
+    
+    return all_passed
+
+def test_negative_amount():
+    """Check that negative amounts are rejected instead of returning bogus counts."""
+    
+    print("\n" + "=" * 50)
+    print("Testing negative amounts")
+    print("=" * 50)
+    
+    all_passed = True
+    
+    for amount in [-1, -5, -62, -1200]:
+        try:
+            result = calculate_coins(amount)
+        except ValueError:
+            print(f"✅ Amount {amount:5d}¢ -> ValueError - PASSED")
+        else:
+            print(f"❌ Amount {amount:5d}¢ - FAILED (expected ValueError, got {result})")
+            all_passed = False
+    
+    return all_passed
+
 def demonstrate_greedy_vs_optimal():
-    """Demonstrate cases where greedy algorithm fails but DP succeeds."""
+    """Demonstrate cases where greedy algorithm fails but the limited-coin search succeeds."""
     
     print("\n" + "=" * 60)
     print("GREEDY vs OPTIMAL COMPARISON")
@@ -144,7 +209,7 @@ def demonstrate_greedy_vs_optimal():
     for amount in problem_cases:
         print(f"\nAmount: {amount}¢")
         
-        # Calculate optimal solution using DP
+        # Calculate optimal solution using the limited-coin search
         optimal = calculate_coins(amount)
         optimal_coins = sum(optimal.values())
         
@@ -157,11 +222,11 @@ def demonstrate_greedy_vs_optimal():
                 remaining = remaining % coin
         greedy_coins = sum(greedy.values())
         
-        print(f"  Optimal (DP): {optimal_coins} coins - {optimal}")
+        print(f"  Optimal:      {optimal_coins} coins - {optimal}")
         print(f"  Greedy:       {greedy_coins} coins - {greedy}")
         
         if optimal_coins < greedy_coins:
-            print(f"  💡 DP saves {greedy_coins - optimal_coins} coins!")
+            print(f"  💡 Search saves {greedy_coins - optimal_coins} coins!")
         elif optimal_coins == greedy_coins:
             print(f"  ✅ Both methods give same result")
 
@@ -176,20 +241,24 @@ def performance_test():
     
     large_amounts = [1000, 2500, 5000]
     
-    for amount in large_amounts:
-        start_time = time.time()
-        result = calculate_coins(amount)
-        end_time = time.time()
-        
+    start_time = time.time()
+    results = calculate_coins_many(large_amounts)
+    end_time = time.time()
+    
+    execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
+    
+    for amount, result in zip(large_amounts, results):
         total_coins = sum(result.values())
-        execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
-        
-        print(f"Amount: {amount:4d}¢ -> {total_coins:3d} coins in {execution_time:.2f}ms")
+        print(f"Amount: {amount:4d}¢ -> {total_coins:3d} coins")
         print(f"  Breakdown: {result}")
+    
+    print(f"Batch of {len(large_amounts)} amounts in {execution_time:.2f}ms")
 
 if __name__ == "__main__":
     # Run all tests
     success = test_coin_change()
+    success = test_calculate_coins_many() and success
+    success = test_negative_amount() and success
     demonstrate_greedy_vs_optimal()
     performance_test()
     